@@ -6,18 +6,40 @@ Tests single blob read/write operations with single and concurrent clients.
 """
 
 import argparse
+import array
+import asyncio
+import base64
+import hashlib
+import hmac
+import http.client
+import io
 import os
-import signal
+import queue
 import socket
-import subprocess
+import statistics
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 
+from azure.core.exceptions import ResourceExistsError
 from azure.storage.blob import BlobServiceClient
 
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "python")
+)
+from _server import (  # noqa: E402
+    DEV_ACCOUNT_KEY,
+    ServerManager,
+    build_once,
+    nodelay_adapter,
+    release_binary_path,
+)
+
+API_VERSION = "2021-08-06"
+
 
 @dataclass
 class BenchmarkResult:
@@ -30,84 +52,298 @@ class BenchmarkResult:
     total_time: float
     ops_per_second: float
     mb_per_second: float
+    p50_us: float = 0.0
+    p95_us: float = 0.0
+    p99_us: float = 0.0
+
+
+def parse_connection_string(connection_string: str) -> dict:
+    """Parse a connection string into its key/value parts."""
+    parts = dict(
+        p.split("=", 1) for p in connection_string.rstrip(";").split(";")
+    )
+    host, port = parts["BlobEndpoint"].split("/")[2].split(":")
+    return {
+        "host": host,
+        "port": int(port),
+        "account": parts["AccountName"],
+        # SAS connection strings carry no account key; the raw drivers still
+        # sign with the well-known devstore key.
+        "key": parts.get("AccountKey", DEV_ACCOUNT_KEY),
+    }
+
+
+def sign_shared_key(
+    verb: str,
+    account: str,
+    key: str,
+    path: str,
+    content_length: int = 0,
+    ms_headers: Optional[dict] = None,
+) -> str:
+    """Compute a SharedKey Authorization header for a request.
+
+    The canonicalized resource for the emulator is /{account}{path} where
+    the path already includes the account segment.
+    """
+    canonicalized_headers = "".join(
+        f"{k.lower()}:{v}\n" for k, v in sorted((ms_headers or {}).items())
+    )
+    string_to_sign = "\n".join([
+        verb,
+        "",  # Content-Encoding
+        "",  # Content-Language
+        str(content_length) if content_length else "",
+        "",  # Content-MD5
+        "",  # Content-Type
+        "",  # Date (x-ms-date is in canonicalized headers)
+        "",  # If-Modified-Since
+        "",  # If-Match
+        "",  # If-None-Match
+        "",  # If-Unmodified-Since
+        "",  # Range
+    ]) + "\n" + canonicalized_headers + f"/{account}{path}"
+    h = _hmac_for_key(key)
+    h.update(string_to_sign.encode("utf-8"))
+    signature = base64.b64encode(h.digest()).decode("utf-8")
+    return f"SharedKey {account}:{signature}"
+
+
+_hmac_seeds: dict = {}
+
+
+def _hmac_for_key(key: str):
+    """Return a fresh HMAC for the account key, cloned from a cached seed.
+
+    Keying the HMAC costs two SHA-256 blocks; copying an initialized state
+    per request skips that.
+    """
+    seed = _hmac_seeds.get(key)
+    if seed is None:
+        seed = hmac.new(base64.b64decode(key), digestmod=hashlib.sha256)
+        _hmac_seeds[key] = seed
+    return seed.copy()
+
+
+def _new_latency_array(n: int):
+    """Preallocate an int64 array for per-op latencies in nanoseconds."""
+    return array.array("q", bytes(8 * n))
+
+
+def _latency_percentiles(latencies) -> tuple:
+    """Return (p50, p95, p99) of nanosecond latencies, in microseconds."""
+    if len(latencies) < 2:
+        us = latencies[0] / 1000.0 if len(latencies) else 0.0
+        return (us, us, us)
+    q = statistics.quantiles(latencies, n=100)
+    return (q[49] / 1000.0, q[94] / 1000.0, q[98] / 1000.0)
+
+
+async def _write_blob(session, url: str, headers: dict, data: bytes, latencies, i: int):
+    """Issue a single Put Blob request over an aiohttp session."""
+    t0 = time.perf_counter_ns()
+    async with session.put(url, data=data, headers=headers) as resp:
+        resp.raise_for_status()
+        await resp.read()
+    latencies[i] = time.perf_counter_ns() - t0
+
+
+async def _read_blob(session, url: str, headers: dict, latencies, i: int):
+    """Issue a single Get Blob request over an aiohttp session."""
+    t0 = time.perf_counter_ns()
+    async with session.get(url, headers=headers) as resp:
+        resp.raise_for_status()
+        await resp.read()
+    latencies[i] = time.perf_counter_ns() - t0
+
+
+def _run_aiohttp(
+    endpoint: dict, requests: list, data: Optional[bytes], num_clients: int
+) -> tuple:
+    """Run prepared (path, headers) requests concurrently.
+
+    Signatures are precomputed per URL before the clock starts, so the timed
+    region only covers the HTTP traffic itself. Returns (total_time,
+    per-op latencies in ns); task latencies include event-loop queuing.
+    """
+    import aiohttp
+
+    latencies = _new_latency_array(len(requests))
+
+    async def _run():
+        if endpoint.get("uds_path"):
+            connector = aiohttp.UnixConnector(
+                path=endpoint["uds_path"], limit=num_clients
+            )
+            base_url = "http://localhost"
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=num_clients, limit_per_host=num_clients, force_close=False
+            )
+            base_url = f"http://{endpoint['host']}:{endpoint['port']}"
+        # aiohttp would add Content-Type: application/octet-stream, which is
+        # not part of the precomputed signature.
+        async with aiohttp.ClientSession(
+            connector=connector, skip_auto_headers=("Content-Type",)
+        ) as session:
+            async with asyncio.TaskGroup() as tg:
+                for i, (path, headers) in enumerate(requests):
+                    url = base_url + path
+                    if data is not None:
+                        tg.create_task(
+                            _write_blob(session, url, headers, data, latencies, i)
+                        )
+                    else:
+                        tg.create_task(
+                            _read_blob(session, url, headers, latencies, i)
+                        )
 
-
-def find_free_port():
-    """Find a free port on localhost."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
+    start = time.perf_counter()
+    asyncio.run(_run())
+    return time.perf_counter() - start, latencies
 
 
-def wait_for_server(host, port, timeout=30):
-    """Wait for server to be ready."""
-    start = time.time()
-    while time.time() - start < timeout:
-        try:
-            with socket.create_connection((host, port), timeout=1):
-                return True
-        except (ConnectionRefusedError, socket.timeout, OSError):
-            time.sleep(0.1)
-    return False
-
-
-class ServerManager:
-    """Manages starting and stopping storage servers."""
-
-    def __init__(self):
-        self.process: Optional[subprocess.Popen] = None
-        self.port: int = 0
-        self.account = "devstoreaccount1"
-        self.key = "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
-
-    def start_azurite_rs(self, binary_path: str) -> str:
-        """Start azurite-rs server."""
-        self.port = find_free_port()
-        self.process = subprocess.Popen(
-            [binary_path, "--blob-port", str(self.port), "--in-memory", "--silent"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        if not wait_for_server("127.0.0.1", self.port):
-            self.stop()
-            raise RuntimeError("azurite-rs failed to start")
-        return self._connection_string()
-
-    def start_azurite_node(self, azurite_path: str) -> str:
-        """Start Azurite (Node.js) server."""
-        self.port = find_free_port()
-        self.process = subprocess.Popen(
-            ["node", os.path.join(azurite_path, "dist/src/blob/main.js"),
-             "--blobPort", str(self.port),
-             "--inMemoryPersistence",
-             "--silent",
-             "--skipApiVersionCheck"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=azurite_path,
-        )
-        if not wait_for_server("127.0.0.1", self.port):
-            self.stop()
-            raise RuntimeError("Azurite (Node.js) failed to start")
-        return self._connection_string()
-
-    def _connection_string(self) -> str:
-        return (
-            f"DefaultEndpointsProtocol=http;"
-            f"AccountName={self.account};"
-            f"AccountKey={self.key};"
-            f"BlobEndpoint=http://127.0.0.1:{self.port}/{self.account};"
+def _prepare_requests(
+    endpoint: dict,
+    verb: str,
+    blob_paths: list,
+    content_length: int = 0,
+) -> list:
+    """Precompute paths and signed headers for a batch of blob requests."""
+    date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    ms_headers = {"x-ms-date": date, "x-ms-version": API_VERSION}
+    if verb == "PUT":
+        ms_headers["x-ms-blob-type"] = "BlockBlob"
+
+    requests = []
+    for blob_path in blob_paths:
+        path = f"/{endpoint['account']}/{blob_path}"
+        auth = sign_shared_key(
+            verb, endpoint["account"], endpoint["key"], path,
+            content_length=content_length, ms_headers=ms_headers,
         )
+        headers = dict(ms_headers, Authorization=auth)
+        requests.append((path, headers))
+    return requests
+
+
+class _UDSHTTPConnection(http.client.HTTPConnection):
+    """http.client connection that dials a Unix domain socket."""
 
-    def stop(self):
-        """Stop the server."""
-        if self.process:
-            self.process.send_signal(signal.SIGTERM)
+    def __init__(self, uds_path: str):
+        super().__init__("localhost")
+        self._uds_path = uds_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._uds_path)
+
+
+def _run_raw_single_client(
+    endpoint: dict, verb: str, requests: list, data: Optional[bytes]
+) -> tuple:
+    """Drive prepared requests over one keep-alive http.client connection.
+
+    Bypasses the SDK pipeline entirely so the single-client numbers measure
+    the server, not per-request Python overhead. Returns (total_time,
+    per-op latencies in ns).
+    """
+    latencies = _new_latency_array(len(requests))
+    if endpoint.get("uds_path"):
+        conn = _UDSHTTPConnection(endpoint["uds_path"])
+        conn.connect()
+    else:
+        conn = http.client.HTTPConnection(endpoint["host"], endpoint["port"])
+        conn.connect()
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        start = time.perf_counter()
+        for i, (path, headers) in enumerate(requests):
+            t0 = time.perf_counter_ns()
+            conn.request(verb, path, body=data, headers=headers)
+            conn.getresponse().read()
+            latencies[i] = time.perf_counter_ns() - t0
+        return time.perf_counter() - start, latencies
+    finally:
+        conn.close()
+
+
+def _run_parallel(fn, n: int, workers: int):
+    """Run fn(0..n-1) across worker threads without allocating a Future per op.
+
+    A bounded queue feeds indices to the workers and is sentinel-terminated;
+    the first worker exception is re-raised after join.
+    """
+    work = queue.Queue(maxsize=workers * 4)
+    errors = []
+
+    def worker():
+        while True:
+            i = work.get()
+            if i is None:
+                return
             try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-            self.process = None
+                fn(i)
+            except Exception as exc:
+                errors.append(exc)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    for i in range(n):
+        work.put(i)
+    for _ in threads:
+        work.put(None)
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+
+
+def make_sdk_client(connection_string: str, pool_size: int) -> BlobServiceClient:
+    """Create a BlobServiceClient with a connection pool sized for the run.
+
+    The SDK's default urllib3 pool holds 10 connections, so more workers than
+    that pay TCP setup per request and leak TIME_WAIT sockets on long runs.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+
+    session = requests.Session()
+    session.mount("http://", nodelay_adapter(pool_size))
+    return BlobServiceClient.from_connection_string(
+        connection_string,
+        connection_timeout=5,
+        read_timeout=30,
+        max_single_put_size=64 * 1024 * 1024,
+        # The logging and retry policies allocate dicts and walk kwargs on
+        # every request; against a local emulator they only add overhead.
+        logging_enable=False,
+        user_agent="bench",
+        retry_total=0,
+        retry_connect=0,
+        retry_read=0,
+        retry_status=0,
+        transport=RequestsTransport(session=session),
+    )
+
+
+_container_clients: dict = {}
+
+
+def _get_container_client(client: BlobServiceClient, container_name: str):
+    """Cache ContainerClients so repeated runs share one client and pipeline.
+
+    Keyed by the account URL rather than id(client): ids are reused once a
+    client is garbage-collected, and the two servers in an A/B run use the
+    same container names, so an id collision would route ops to the wrong
+    (stopped) server. URLs differ per server because the port does.
+    """
+    key = (client.url, container_name)
+    cc = _container_clients.get(key)
+    if cc is None:
+        cc = _container_clients[key] = client.get_container_client(container_name)
+    return cc
 
 
 def run_write_benchmark(
@@ -116,19 +352,62 @@ def run_write_benchmark(
     blob_size: int,
     num_operations: int,
     num_clients: int,
-) -> float:
-    """Run write benchmark and return total time."""
-    container_client = client.get_container_client(container_name)
-    try:
-        container_client.create_container()
-    except Exception:
-        pass
+    driver: str = "aiohttp",
+    endpoint: Optional[dict] = None,
+    single_client_driver: str = "sdk",
+) -> tuple:
+    """Run write benchmark; returns (total_time, (p50_us, p95_us, p99_us)).
+
+    The target container must already exist; run_benchmarks creates the full
+    matrix of containers up front.
+    """
+    container_client = _get_container_client(client, container_name)
+
+    # One shared buffer for the whole run; every op sends the same object so
+    # the payload is never reallocated per op.
+    buf = bytearray(blob_size)
+
+    if num_clients == 1 and single_client_driver == "raw":
+        requests = _prepare_requests(
+            endpoint, "PUT",
+            [f"{container_name}/blob-{i}" for i in range(num_operations)],
+            content_length=blob_size,
+        )
+        total_time, latencies = _run_raw_single_client(endpoint, "PUT", requests, buf)
+        return total_time, _latency_percentiles(latencies)
+
+    if driver == "aiohttp":
+        requests = _prepare_requests(
+            endpoint, "PUT",
+            [f"{container_name}/blob-{i}" for i in range(num_operations)],
+            content_length=blob_size,
+        )
+        total_time, latencies = _run_aiohttp(endpoint, requests, buf, num_clients)
+        return total_time, _latency_percentiles(latencies)
+
+    latencies = _new_latency_array(num_operations)
 
-    data = b"x" * blob_size
+    # Handing the SDK an already-open stream skips the BytesIO wrap (and
+    # copy) it does for a bytes payload; rewinding reuses the same buffer
+    # for every op, one stream per worker thread.
+    payload = bytes(buf)
+    tl = threading.local()
 
     def write_blob(i: int):
-        blob_client = container_client.get_blob_client(f"blob-{i}")
-        blob_client.upload_blob(data, overwrite=True)
+        t0 = time.perf_counter_ns()
+        stream = getattr(tl, "stream", None)
+        if stream is None:
+            stream = tl.stream = io.BytesIO(payload)
+        stream.seek(0)
+        # Uploading through the ContainerClient reuses its pipeline instead
+        # of allocating a throwaway BlobClient per op; length= makes the SDK
+        # issue a single-shot Put Blob instead of the chunked uploader,
+        # which would copy the payload.
+        container_client.upload_blob(
+            name=f"blob-{i}", data=stream, length=blob_size,
+            overwrite=True, max_concurrency=1,
+        )
+        latencies[i] = time.perf_counter_ns() - t0
 
     start = time.perf_counter()
 
@@ -136,12 +415,9 @@ def run_write_benchmark(
         for i in range(num_operations):
             write_blob(i)
     else:
-        with ThreadPoolExecutor(max_workers=num_clients) as executor:
-            futures = [executor.submit(write_blob, i) for i in range(num_operations)]
-            for future in as_completed(futures):
-                future.result()
+        _run_parallel(write_blob, num_operations, num_clients)
 
-    return time.perf_counter() - start
+    return time.perf_counter() - start, _latency_percentiles(latencies)
 
 
 def run_read_benchmark(
@@ -150,17 +426,48 @@ def run_read_benchmark(
     blob_size: int,
     num_operations: int,
     num_clients: int,
-) -> float:
-    """Run read benchmark and return total time."""
-    container_client = client.get_container_client(container_name)
+    driver: str = "aiohttp",
+    endpoint: Optional[dict] = None,
+    single_client_driver: str = "sdk",
+) -> tuple:
+    """Run read benchmark; returns (total_time, (p50_us, p95_us, p99_us)).
+
+    Reads "read-blob" from container_name; run_benchmarks seeds it once per
+    blob size.
+    """
+    container_client = _get_container_client(client, container_name)
+
+    if num_clients == 1 and single_client_driver == "raw":
+        requests = _prepare_requests(
+            endpoint, "GET",
+            [f"{container_name}/read-blob"] * num_operations,
+        )
+        total_time, latencies = _run_raw_single_client(endpoint, "GET", requests, None)
+        return total_time, _latency_percentiles(latencies)
 
-    # Create a blob to read
-    data = b"x" * blob_size
-    blob_client = container_client.get_blob_client("read-blob")
-    blob_client.upload_blob(data, overwrite=True)
+    if driver == "aiohttp":
+        requests = _prepare_requests(
+            endpoint, "GET",
+            [f"{container_name}/read-blob"] * num_operations,
+        )
+        total_time, latencies = _run_aiohttp(endpoint, requests, None, num_clients)
+        return total_time, _latency_percentiles(latencies)
 
-    def read_blob(_: int):
-        blob_client.download_blob().readall()
+    # Download into preallocated per-thread streams so no per-op bytes
+    # object is allocated on the heap; readinto() wants a writable stream,
+    # and rewinding the same BytesIO overwrites it in place every op.
+    blob_client = container_client.get_blob_client("read-blob")
+    tl = threading.local()
+    latencies = _new_latency_array(num_operations)
+
+    def read_blob(i: int):
+        t0 = time.perf_counter_ns()
+        stream = getattr(tl, "stream", None)
+        if stream is None:
+            stream = tl.stream = io.BytesIO(bytes(blob_size))
+        stream.seek(0)
+        blob_client.download_blob(max_concurrency=1).readinto(stream)
+        latencies[i] = time.perf_counter_ns() - t0
 
     start = time.perf_counter()
 
@@ -168,12 +475,39 @@ def run_read_benchmark(
         for i in range(num_operations):
             read_blob(i)
     else:
-        with ThreadPoolExecutor(max_workers=num_clients) as executor:
-            futures = [executor.submit(read_blob, i) for i in range(num_operations)]
-            for future in as_completed(futures):
-                future.result()
+        _run_parallel(read_blob, num_operations, num_clients)
+
+    return time.perf_counter() - start, _latency_percentiles(latencies)
 
-    return time.perf_counter() - start
+
+def _probe_concurrency(
+    client: BlobServiceClient,
+    container_name: str,
+    blob_size: int,
+    endpoint: dict,
+    driver: str,
+    single_client_driver: str,
+) -> list:
+    """Probe worker counts on the write path and return the peak plus neighbors.
+
+    More workers does not mean more throughput once the server (or the
+    driver) saturates; prints the measured ops/s curve so a regression shows
+    up as flattening at low counts.
+    """
+    probes = [1, 2, 4, 8, 16, 32, 64]
+    num_operations = 200
+    curve = []
+    for c in probes:
+        total_time, _ = run_write_benchmark(
+            client, container_name, blob_size, num_operations, c,
+            driver=driver, endpoint=endpoint,
+            single_client_driver=single_client_driver,
+        )
+        curve.append(num_operations / total_time)
+    print(f"  concurrency curve ({format_size(blob_size)} writes): "
+          + ", ".join(f"{c}={ops:.0f} ops/s" for c, ops in zip(probes, curve)))
+    peak = curve.index(max(curve))
+    return probes[max(peak - 1, 0):peak + 2]
 
 
 def run_benchmarks(
@@ -182,18 +516,69 @@ def run_benchmarks(
     blob_sizes: list,
     num_operations: int,
     client_counts: list,
+    driver: str = "aiohttp",
+    single_client_driver: str = "sdk",
+    auto_concurrency: bool = False,
+    uds_path: Optional[str] = None,
 ) -> list:
-    """Run all benchmarks for a server."""
+    """Run all benchmarks for a server.
+
+    With auto_concurrency, the fixed client_counts are replaced per blob size
+    by the counts around the measured write-throughput peak.
+    """
     results = []
-    client = BlobServiceClient.from_connection_string(connection_string)
+    client = make_sdk_client(connection_string, max(client_counts))
+    endpoint = parse_connection_string(connection_string)
+    # Setup traffic (containers, read seeds) stays on TCP via the SDK; only
+    # the measured raw/aiohttp requests use the Unix socket.
+    endpoint["uds_path"] = uds_path
+
+    # Create the whole container matrix up front and seed one read-source
+    # blob per size, instead of paying a create_container round-trip (and a
+    # swallowed 409) per combination.
+    for blob_size in blob_sizes:
+        if auto_concurrency:
+            try:
+                client.create_container(f"bench-{blob_size}-probe")
+            except ResourceExistsError:
+                pass
+        else:
+            for num_clients in client_counts:
+                try:
+                    client.create_container(f"bench-{blob_size}-{num_clients}")
+                except ResourceExistsError:
+                    pass
+        source_name = f"read-source-{blob_size}"
+        try:
+            client.create_container(source_name)
+        except ResourceExistsError:
+            pass
+        client.get_container_client(source_name).upload_blob(
+            "read-blob", b"x" * blob_size, overwrite=True
+        )
 
     for blob_size in blob_sizes:
-        for num_clients in client_counts:
+        source_container = f"read-source-{blob_size}"
+        if auto_concurrency:
+            counts = _probe_concurrency(
+                client, f"bench-{blob_size}-probe", blob_size, endpoint,
+                driver, single_client_driver,
+            )
+            for num_clients in counts:
+                try:
+                    client.create_container(f"bench-{blob_size}-{num_clients}")
+                except ResourceExistsError:
+                    pass
+        else:
+            counts = client_counts
+        for num_clients in counts:
             container_name = f"bench-{blob_size}-{num_clients}"
 
             # Write benchmark
-            total_time = run_write_benchmark(
-                client, container_name, blob_size, num_operations, num_clients
+            total_time, (p50, p95, p99) = run_write_benchmark(
+                client, container_name, blob_size, num_operations, num_clients,
+                driver=driver, endpoint=endpoint,
+                single_client_driver=single_client_driver,
             )
             ops_per_sec = num_operations / total_time
             mb_per_sec = (num_operations * blob_size) / total_time / (1024 * 1024)
@@ -206,11 +591,16 @@ def run_benchmarks(
                 total_time=total_time,
                 ops_per_second=ops_per_sec,
                 mb_per_second=mb_per_sec,
+                p50_us=p50,
+                p95_us=p95,
+                p99_us=p99,
             ))
 
             # Read benchmark
-            total_time = run_read_benchmark(
-                client, container_name, blob_size, num_operations, num_clients
+            total_time, (p50, p95, p99) = run_read_benchmark(
+                client, source_container, blob_size, num_operations, num_clients,
+                driver=driver, endpoint=endpoint,
+                single_client_driver=single_client_driver,
             )
             ops_per_sec = num_operations / total_time
             mb_per_sec = (num_operations * blob_size) / total_time / (1024 * 1024)
@@ -223,6 +613,9 @@ def run_benchmarks(
                 total_time=total_time,
                 ops_per_second=ops_per_sec,
                 mb_per_second=mb_per_sec,
+                p50_us=p50,
+                p95_us=p95,
+                p99_us=p99,
             ))
 
     return results
@@ -250,6 +643,9 @@ def print_results(results: list):
     client_counts = sorted(set(r.num_clients for r in results))
     servers = sorted(set(r.server for r in results))
 
+    # Index once so each table cell is a dict lookup, not a scan of results.
+    idx = {(r.operation, r.blob_size, r.num_clients, r.server): r for r in results}
+
     for operation in operations:
         print(f"\n{operation.upper()} Operations")
         print("-" * 100)
@@ -258,6 +654,7 @@ def print_results(results: list):
         header = f"{'Blob Size':<12} {'Clients':<10}"
         for server in servers:
             header += f" {server + ' ops/s':<18} {server + ' MB/s':<15}"
+            header += f" {server + ' p50/p95/p99 us':<24}"
         if len(servers) == 2:
             header += f" {'Speedup':<10}"
         print(header)
@@ -269,11 +666,11 @@ def print_results(results: list):
 
                 server_results = {}
                 for server in servers:
-                    for r in results:
-                        if (r.operation == operation and r.blob_size == blob_size
-                                and r.num_clients == num_clients and r.server == server):
-                            server_results[server] = r
-                            row += f" {r.ops_per_second:>14.1f}     {r.mb_per_second:>11.2f}    "
+                    r = idx.get((operation, blob_size, num_clients, server))
+                    if r is not None:
+                        server_results[server] = r
+                        row += f" {r.ops_per_second:>14.1f}     {r.mb_per_second:>11.2f}    "
+                        row += f" {r.p50_us:>6.0f}/{r.p95_us:>6.0f}/{r.p99_us:>6.0f}       "
 
                 # Calculate speedup if we have both servers
                 if len(server_results) == 2 and "azurite-rs" in server_results and "azurite" in server_results:
@@ -287,8 +684,9 @@ def print_results(results: list):
 
 def main():
     parser = argparse.ArgumentParser(description="Benchmark azurite-rs vs Azurite")
-    parser.add_argument("--azurite-rs", default="./target/release/azurite-rs",
-                        help="Path to azurite-rs binary")
+    parser.add_argument("--azurite-rs", default=None,
+                        help="Path to azurite-rs binary (default: the release "
+                             "binary under CARGO_TARGET_DIR or ./target)")
     parser.add_argument("--azurite", default="../Azurite",
                         help="Path to Azurite directory")
     parser.add_argument("--operations", type=int, default=1000,
@@ -299,24 +697,56 @@ def main():
                         help="Comma-separated client counts")
     parser.add_argument("--only", choices=["azurite-rs", "azurite"],
                         help="Only benchmark one server")
+    parser.add_argument("--driver", choices=["sdk", "aiohttp"], default="aiohttp",
+                        help="HTTP driver: Azure SDK over threads, or aiohttp (async)")
+    parser.add_argument("--single-client-driver", choices=["sdk", "raw"], default="sdk",
+                        help="Driver for num_clients=1: the configured driver, or a "
+                             "raw keep-alive http.client connection")
+    parser.add_argument("--auth", choices=["shared-key", "sas"], default="sas",
+                        help="SDK auth: per-request SharedKey HMAC, or a SAS token "
+                             "generated once per server")
+    parser.add_argument("--auto-concurrency", action="store_true",
+                        help="Probe client counts for the write-throughput peak "
+                             "per blob size instead of using --clients")
+    parser.add_argument("--transport", choices=["tcp", "uds"], default="tcp",
+                        help="Transport for the aiohttp/raw drivers against "
+                             "azurite-rs: TCP loopback or a Unix domain socket")
+    parser.add_argument("--skip-build", action="store_true",
+                        help="Assume the azurite-rs binary is already built")
     args = parser.parse_args()
 
     blob_sizes = [int(s) for s in args.blob_sizes.split(",")]
     client_counts = [int(c) for c in args.clients.split(",")]
 
     all_results = []
-    server_manager = ServerManager()
-
-    # Build azurite-rs first
-    print("Building azurite-rs...")
-    subprocess.run(["cargo", "build", "--release"], check=True, capture_output=True)
+    server_manager = ServerManager(use_sas=(args.auth == "sas"))
+
+    # Build azurite-rs first (build_once is a no-op when the binary is up
+    # to date, and prints only when it actually rebuilds)
+    binary_path = args.azurite_rs
+    if binary_path is None:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        if args.skip_build:
+            binary_path = release_binary_path(project_root)
+        else:
+            binary_path = build_once(project_root)
+    elif not args.skip_build:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        build_once(project_root)
 
     try:
         if args.only != "azurite":
             print(f"\nStarting azurite-rs benchmark...")
-            conn_str = server_manager.start_azurite_rs(args.azurite_rs)
+            uds_path = None
+            if args.transport == "uds":
+                uds_path = f"/tmp/azurite-bench-{os.getpid()}.sock"
+            conn_str = server_manager.start_azurite_rs(binary_path, uds_path=uds_path)
             results = run_benchmarks(conn_str, "azurite-rs", blob_sizes,
-                                     args.operations, client_counts)
+                                     args.operations, client_counts,
+                                     driver=args.driver,
+                                     single_client_driver=args.single_client_driver,
+                                     auto_concurrency=args.auto_concurrency,
+                                     uds_path=uds_path)
             all_results.extend(results)
             server_manager.stop()
 
@@ -324,7 +754,10 @@ def main():
             print(f"\nStarting Azurite (Node.js) benchmark...")
             conn_str = server_manager.start_azurite_node(args.azurite)
             results = run_benchmarks(conn_str, "azurite", blob_sizes,
-                                     args.operations, client_counts)
+                                     args.operations, client_counts,
+                                     driver=args.driver,
+                                     single_client_driver=args.single_client_driver,
+                                     auto_concurrency=args.auto_concurrency)
             all_results.extend(results)
             server_manager.stop()
 
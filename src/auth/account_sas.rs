@@ -31,6 +31,8 @@ pub struct AccountSasParameters {
     pub signed_ip: Option<String>,
     /// Signed protocol (spr) - optional.
     pub signed_protocol: Option<String>,
+    /// Signed encryption scope (ses) - optional, 2020-12-06 and later.
+    pub signed_encryption_scope: Option<String>,
     /// Signature (sig).
     pub signature: String,
 }
@@ -51,6 +53,7 @@ impl AccountSasParameters {
         let signed_start = params.get("st").and_then(|s| parse_sas_datetime(s));
         let signed_ip = params.get("sip").cloned();
         let signed_protocol = params.get("spr").cloned();
+        let signed_encryption_scope = params.get("ses").cloned();
         let signature = params.get("sig")?.clone();
 
         Some(Self {
@@ -62,6 +65,7 @@ impl AccountSasParameters {
             signed_start,
             signed_ip,
             signed_protocol,
+            signed_encryption_scope,
             signature,
         })
     }
@@ -162,9 +166,13 @@ impl AccountSasParameters {
         parts.push(self.signed_ip.clone().unwrap_or_default());
         parts.push(self.signed_protocol.clone().unwrap_or_default());
         parts.push(self.signed_version.clone());
-        // For 2020-12-06 and later versions, there are additional fields
-        // but we'll use the simpler format for compatibility
-        parts.push(String::new()); // signed encryption scope (optional)
+        // Version 2020-12-06 added the signed encryption scope field; every
+        // field is newline-terminated, so older versions end with "sv\n" and
+        // newer ones with "sv\nses\n".
+        if self.signed_version.as_str() >= "2020-12-06" {
+            parts.push(self.signed_encryption_scope.clone().unwrap_or_default());
+        }
+        parts.push(String::new());
 
         parts.join("\n")
     }
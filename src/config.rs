@@ -58,6 +58,10 @@ pub struct Args {
     #[arg(long)]
     pub in_memory: bool,
 
+    /// Additionally serve on a Unix domain socket at this path.
+    #[arg(long)]
+    pub uds_path: Option<PathBuf>,
+
     /// OAuth authentication mode.
     #[arg(long)]
     pub oauth: Option<String>,
@@ -87,6 +91,7 @@ impl Default for Args {
             debug: false,
             silent: false,
             in_memory: true,
+            uds_path: None,
             oauth: None,
             cert: None,
             key: None,
@@ -110,6 +115,8 @@ pub struct Config {
     pub skip_api_version_check: bool,
     /// In-memory mode (no persistence).
     pub in_memory: bool,
+    /// Additionally serve on a Unix domain socket at this path.
+    pub uds_path: Option<PathBuf>,
     /// Enable debug logging.
     pub debug: bool,
     /// Default account credentials.
@@ -132,6 +139,7 @@ impl Default for Config {
             loose: false,
             skip_api_version_check: false,
             in_memory: true,
+            uds_path: None,
             debug: false,
             accounts: vec![AccountConfig {
                 name: DEFAULT_ACCOUNT.to_string(),
@@ -151,6 +159,7 @@ impl From<Args> for Config {
             loose: args.loose,
             skip_api_version_check: args.skip_api_version_check,
             in_memory,
+            uds_path: args.uds_path,
             debug: args.debug,
             accounts: vec![AccountConfig {
                 name: DEFAULT_ACCOUNT.to_string(),
@@ -74,6 +74,18 @@ impl BlobServer {
                 .unwrap_or("unknown")
         );
 
+        // Local clients (benchmarks, CI) can skip the TCP stack entirely by
+        // connecting to the Unix domain socket; TCP stays available for SDK
+        // clients that only speak host:port endpoints.
+        if let Some(path) = self.config.uds_path.clone() {
+            let uds_app = app.clone();
+            tokio::spawn(async move {
+                if let Err(err) = serve_uds(path, uds_app).await {
+                    tracing::error!("UDS listener failed: {err}");
+                }
+            });
+        }
+
         let listener = TcpListener::bind(addr).await?;
         axum::serve(listener, app).await?;
 
@@ -91,6 +103,46 @@ impl BlobServer {
     }
 }
 
+/// Serves the router over a Unix domain socket.
+///
+/// axum::serve only accepts TCP listeners, so connections are accepted
+/// manually and handed to hyper's HTTP/1 connection driver.
+async fn serve_uds(
+    path: std::path::PathBuf,
+    app: axum::Router,
+) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
+    use hyper::body::Incoming;
+    use hyper_util::rt::TokioIo;
+    use tokio::net::UnixListener;
+    use tower::{Service, ServiceExt};
+
+    // Remove a stale socket file left behind by a previous run.
+    let _ = std::fs::remove_file(&path);
+
+    let listener = UnixListener::bind(&path)?;
+    info!("Azurite Blob service is listening on {}", path.display());
+
+    let mut make_service = app.into_make_service();
+
+    loop {
+        let (socket, _remote_addr) = listener.accept().await?;
+        let tower_service = make_service.call(&socket).await.unwrap();
+        tokio::spawn(async move {
+            let socket = TokioIo::new(socket);
+            let hyper_service =
+                hyper::service::service_fn(move |request: hyper::Request<Incoming>| {
+                    tower_service.clone().oneshot(request)
+                });
+            if let Err(err) = hyper::server::conn::http1::Builder::new()
+                .serve_connection(socket, hyper_service)
+                .await
+            {
+                tracing::debug!("UDS connection error: {err}");
+            }
+        });
+    }
+}
+
 /// Builder for creating a blob server.
 pub struct BlobServerBuilder {
     config: Config,
@@ -4,30 +4,12 @@ Pytest fixtures for Azure SDK Python tests.
 
 import os
 import signal
-import socket
 import subprocess
-import time
+import threading
 
 import pytest
 
-
-def find_free_port():
-    """Find a free port on localhost."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
-
-
-def wait_for_server(host, port, timeout=30):
-    """Wait for server to be ready."""
-    start = time.time()
-    while time.time() - start < timeout:
-        try:
-            with socket.create_connection((host, port), timeout=1):
-                return True
-        except (ConnectionRefusedError, socket.timeout):
-            time.sleep(0.1)
-    return False
+from _server import build_once, find_free_port, nodelay_adapter, wait_for_server
 
 
 @pytest.fixture(scope="session")
@@ -37,16 +19,10 @@ def azurite_server():
     test_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(os.path.dirname(test_dir))
 
-    # Build the project first
-    subprocess.run(
-        ["cargo", "build", "--release"],
-        cwd=project_root,
-        check=True,
-        capture_output=True,
-    )
+    # Build the project first (skipped when the binary is up to date)
+    binary_path = build_once(project_root)
 
     port = find_free_port()
-    binary_path = os.path.join(project_root, "target", "release", "azurite-rs")
 
     # Start the server
     process = subprocess.Popen(
@@ -63,6 +39,11 @@ def azurite_server():
             f"Server failed to start.\nstdout: {stdout.decode()}\nstderr: {stderr.decode()}"
         )
 
+    # Keep the pipes drained for the lifetime of the server; an unread PIPE
+    # fills after ~64 KiB of output and blocks the server on write().
+    for stream in (process.stdout, process.stderr):
+        threading.Thread(target=stream.read, daemon=True).start()
+
     server_info = {
         "host": "127.0.0.1",
         "port": port,
@@ -81,7 +62,7 @@ def azurite_server():
         process.kill()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def connection_string(azurite_server):
     """Return connection string for Azure SDK."""
     return (
@@ -92,17 +73,48 @@ def connection_string(azurite_server):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blob_service_client(connection_string):
-    """Create BlobServiceClient for testing."""
+    """Create BlobServiceClient for testing.
+
+    A sized keep-alive connection pool is mounted so concurrent tests share
+    connections instead of opening one per request.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
     from azure.storage.blob import BlobServiceClient
 
-    return BlobServiceClient.from_connection_string(connection_string)
+    session = requests.Session()
+    session.mount("http://", nodelay_adapter(16))
+    return BlobServiceClient.from_connection_string(
+        connection_string, transport=RequestsTransport(session=session)
+    )
 
 
 @pytest.fixture
 def unique_container_name():
-    """Generate a unique container name for testing."""
+    """Generate a unique container name for tests that need a dedicated container."""
     import uuid
 
     return f"test-container-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="session")
+def shared_container(blob_service_client):
+    """Create one container shared by all blob-level tests.
+
+    Creating a container per test costs a round-trip each way; blob tests
+    isolate themselves with a unique blob prefix instead.
+    """
+    import uuid
+
+    name = f"shared-{uuid.uuid4().hex[:8]}"
+    return blob_service_client.create_container(name)
+
+
+@pytest.fixture
+def blob_prefix(request):
+    """Unique per-test blob name prefix inside the shared container."""
+    import uuid
+
+    return f"{request.node.name}-{uuid.uuid4().hex[:6]}/"
@@ -2,6 +2,10 @@
 Tests using the official Azure SDK for Python.
 
 These tests verify that azurite-rs is compatible with the official Azure SDK.
+
+Blob-level tests share one session-scoped container and isolate themselves
+with a unique per-test blob prefix; only the container-lifecycle tests create
+their own container.
 """
 
 import uuid
@@ -89,12 +93,9 @@ def test_container_already_exists(
 # ============================================================================
 
 
-def test_upload_download_blob(
-    blob_service_client: BlobServiceClient, unique_container_name
-):
+def test_upload_download_blob(shared_container: ContainerClient, blob_prefix):
     """Test uploading and downloading a blob."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("test-blob.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "test-blob.txt")
 
     content = b"Hello, Azure SDK for Python!"
 
@@ -106,10 +107,9 @@ def test_upload_download_blob(
     assert downloaded == content
 
 
-def test_upload_large_blob(blob_service_client: BlobServiceClient, unique_container_name):
+def test_upload_large_blob(shared_container: ContainerClient, blob_prefix):
     """Test uploading a large blob."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("large-blob.bin")
+    blob_client = shared_container.get_blob_client(blob_prefix + "large-blob.bin")
 
     # Create 100KB of data
     content = bytes(i % 256 for i in range(100 * 1024))
@@ -123,12 +123,9 @@ def test_upload_large_blob(blob_service_client: BlobServiceClient, unique_contai
     assert downloaded == content
 
 
-def test_blob_with_content_type(
-    blob_service_client: BlobServiceClient, unique_container_name
-):
+def test_blob_with_content_type(shared_container: ContainerClient, blob_prefix):
     """Test uploading a blob with content type."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("data.json")
+    blob_client = shared_container.get_blob_client(blob_prefix + "data.json")
 
     content = b'{"key": "value"}'
 
@@ -140,10 +137,9 @@ def test_blob_with_content_type(
     assert props.content_settings.content_type == "application/json"
 
 
-def test_blob_with_metadata(blob_service_client: BlobServiceClient, unique_container_name):
+def test_blob_with_metadata(shared_container: ContainerClient, blob_prefix):
     """Test uploading a blob with metadata."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("meta-blob.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "meta-blob.txt")
 
     content = b"content with metadata"
     metadata = {"author": "test", "version": "1.0"}
@@ -162,12 +158,9 @@ def test_blob_with_metadata(blob_service_client: BlobServiceClient, unique_conta
 # ============================================================================
 
 
-def test_get_blob_properties(
-    blob_service_client: BlobServiceClient, unique_container_name
-):
+def test_get_blob_properties(shared_container: ContainerClient, blob_prefix):
     """Test getting blob properties."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("props-blob.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "props-blob.txt")
 
     content = b"Test content for properties"
     blob_client.upload_blob(content)
@@ -180,10 +173,9 @@ def test_get_blob_properties(
     assert props.blob_type == "BlockBlob"
 
 
-def test_blob_not_found(blob_service_client: BlobServiceClient, unique_container_name):
+def test_blob_not_found(shared_container: ContainerClient, blob_prefix):
     """Test that accessing a non-existent blob raises an error."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("nonexistent-blob.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "nonexistent-blob.txt")
 
     with pytest.raises(ResourceNotFoundError):
         blob_client.get_blob_properties()
@@ -194,10 +186,9 @@ def test_blob_not_found(blob_service_client: BlobServiceClient, unique_container
 # ============================================================================
 
 
-def test_delete_blob(blob_service_client: BlobServiceClient, unique_container_name):
+def test_delete_blob(shared_container: ContainerClient, blob_prefix):
     """Test deleting a blob."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("delete-me.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "delete-me.txt")
 
     # Upload
     blob_client.upload_blob(b"delete me")
@@ -215,50 +206,42 @@ def test_delete_blob(blob_service_client: BlobServiceClient, unique_container_na
 # ============================================================================
 
 
-def test_list_blobs(blob_service_client: BlobServiceClient, unique_container_name):
+def test_list_blobs(shared_container: ContainerClient, blob_prefix):
     """Test listing blobs."""
-    container_client = blob_service_client.create_container(unique_container_name)
-
     # Upload several blobs
     for i in range(5):
-        blob_client = container_client.get_blob_client(f"blob-{i}.txt")
+        blob_client = shared_container.get_blob_client(f"{blob_prefix}blob-{i}.txt")
         blob_client.upload_blob(f"content {i}".encode())
 
-    # List blobs
-    blobs = list(container_client.list_blobs())
+    # List blobs under this test's prefix
+    blobs = list(shared_container.list_blobs(name_starts_with=blob_prefix))
     names = [b.name for b in blobs]
 
     assert len(names) == 5
     for i in range(5):
-        assert f"blob-{i}.txt" in names
+        assert f"{blob_prefix}blob-{i}.txt" in names
 
 
-def test_list_blobs_with_prefix(
-    blob_service_client: BlobServiceClient, unique_container_name
-):
+def test_list_blobs_with_prefix(shared_container: ContainerClient, blob_prefix):
     """Test listing blobs with a prefix filter."""
-    container_client = blob_service_client.create_container(unique_container_name)
-
     # Upload blobs with different prefixes
     for prefix in ["photos", "documents"]:
         for i in range(3):
-            blob_client = container_client.get_blob_client(f"{prefix}/file-{i}.txt")
+            blob_client = shared_container.get_blob_client(
+                f"{blob_prefix}{prefix}/file-{i}.txt"
+            )
             blob_client.upload_blob(b"content")
 
     # List with prefix
-    blobs = list(container_client.list_blobs(name_starts_with="photos/"))
+    blobs = list(shared_container.list_blobs(name_starts_with=f"{blob_prefix}photos/"))
     names = [b.name for b in blobs]
 
     assert len(names) == 3
-    assert all(n.startswith("photos/") for n in names)
+    assert all(n.startswith(f"{blob_prefix}photos/") for n in names)
 
 
-def test_list_blobs_hierarchical(
-    blob_service_client: BlobServiceClient, unique_container_name
-):
+def test_list_blobs_hierarchical(shared_container: ContainerClient, blob_prefix):
     """Test hierarchical blob listing with delimiter."""
-    container_client = blob_service_client.create_container(unique_container_name)
-
     # Create a directory-like structure
     paths = [
         "root.txt",
@@ -269,21 +252,21 @@ def test_list_blobs_hierarchical(
     ]
 
     for path in paths:
-        blob_client = container_client.get_blob_client(path)
+        blob_client = shared_container.get_blob_client(blob_prefix + path)
         blob_client.upload_blob(b"content")
 
-    # List with delimiter to get "directory" view
+    # List with delimiter to get "directory" view under this test's prefix
     blobs = []
     prefixes = []
-    for item in container_client.walk_blobs(delimiter="/"):
+    for item in shared_container.walk_blobs(name_starts_with=blob_prefix, delimiter="/"):
         if hasattr(item, "prefix"):
             prefixes.append(item.prefix)
         else:
             blobs.append(item.name)
 
-    assert "root.txt" in blobs
-    assert "dir1/" in prefixes
-    assert "dir2/" in prefixes
+    assert blob_prefix + "root.txt" in blobs
+    assert blob_prefix + "dir1/" in prefixes
+    assert blob_prefix + "dir2/" in prefixes
 
 
 # ============================================================================
@@ -291,10 +274,9 @@ def test_list_blobs_hierarchical(
 # ============================================================================
 
 
-def test_download_range(blob_service_client: BlobServiceClient, unique_container_name):
+def test_download_range(shared_container: ContainerClient, blob_prefix):
     """Test downloading a range of bytes from a blob."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("range-blob.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "range-blob.txt")
 
     content = b"0123456789ABCDEFGHIJ"
     blob_client.upload_blob(content)
@@ -309,12 +291,10 @@ def test_download_range(blob_service_client: BlobServiceClient, unique_container
 # ============================================================================
 
 
-def test_copy_blob(blob_service_client: BlobServiceClient, unique_container_name):
+def test_copy_blob(shared_container: ContainerClient, blob_prefix):
     """Test copying a blob."""
-    container_client = blob_service_client.create_container(unique_container_name)
-
-    source_blob = container_client.get_blob_client("source.txt")
-    dest_blob = container_client.get_blob_client("destination.txt")
+    source_blob = shared_container.get_blob_client(blob_prefix + "source.txt")
+    dest_blob = shared_container.get_blob_client(blob_prefix + "destination.txt")
 
     content = b"Content to be copied"
     source_blob.upload_blob(content)
@@ -345,14 +325,11 @@ def test_container_not_found(blob_service_client: BlobServiceClient):
 # ============================================================================
 
 
-def test_concurrent_uploads(
-    blob_service_client: BlobServiceClient, unique_container_name
-):
+def test_concurrent_uploads(shared_container: ContainerClient, blob_prefix):
     """Test uploading blobs concurrently."""
-    container_client = blob_service_client.create_container(unique_container_name)
 
     def upload_blob(i):
-        blob_client = container_client.get_blob_client(f"concurrent-{i}.txt")
+        blob_client = shared_container.get_blob_client(f"{blob_prefix}concurrent-{i}.txt")
         blob_client.upload_blob(f"Content {i}".encode())
         return i
 
@@ -363,7 +340,7 @@ def test_concurrent_uploads(
     assert len(results) == 10
 
     # Verify all blobs exist
-    blobs = list(container_client.list_blobs())
+    blobs = list(shared_container.list_blobs(name_starts_with=blob_prefix))
     assert len(blobs) == 10
 
 
@@ -372,10 +349,9 @@ def test_concurrent_uploads(
 # ============================================================================
 
 
-def test_overwrite_blob(blob_service_client: BlobServiceClient, unique_container_name):
+def test_overwrite_blob(shared_container: ContainerClient, blob_prefix):
     """Test overwriting a blob."""
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("overwrite.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "overwrite.txt")
 
     # Upload initial content
     blob_client.upload_blob(b"initial content")
@@ -388,17 +364,14 @@ def test_overwrite_blob(blob_service_client: BlobServiceClient, unique_container
     assert downloaded == b"new content"
 
 
-def test_upload_without_overwrite_fails(
-    blob_service_client: BlobServiceClient, unique_container_name
-):
+def test_upload_without_overwrite_fails(shared_container: ContainerClient, blob_prefix):
     """Test that uploading without overwrite fails for existing blob.
 
     Note: This test uses conditional headers (If-None-Match: *) to prevent
     overwrites. The behavior depends on server implementation of conditional
     headers.
     """
-    container_client = blob_service_client.create_container(unique_container_name)
-    blob_client = container_client.get_blob_client("no-overwrite.txt")
+    blob_client = shared_container.get_blob_client(blob_prefix + "no-overwrite.txt")
 
     # Upload initial content
     blob_client.upload_blob(b"initial content")